@@ -17,6 +17,11 @@ public partial class BuildViewModel : PageViewModelBase
     private readonly IFeatureService _featureService;
     private readonly ITemplateService _templateService;
     
+    /// <summary>
+    /// Maximum number of entries kept in the build log.
+    /// </summary>
+    private const int MaxBuildLogEntries = 500;
+    
     public override string Title => "Build";
     public override string Icon => "\uE8F1";
     
@@ -401,6 +406,12 @@ public partial class BuildViewModel : PageViewModelBase
             Message = message,
             Level = level
         });
+        
+        // Drop the oldest entries so long builds don't grow the log without bound
+        while (BuildLog.Count > MaxBuildLogEntries)
+        {
+            BuildLog.RemoveAt(0);
+        }
     }
 }
 
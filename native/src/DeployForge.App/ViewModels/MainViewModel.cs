@@ -91,7 +91,9 @@ public partial class MainViewModel : ViewModelBase
             RecentImages.Add(image);
         }
         
-        await WelcomePage.OnNavigatedToAsync();
+        // Not awaited so slow or offline shares in the recent list don't hold
+        // up window activation; the list fills in once the files are checked
+        _ = WelcomePage.OnNavigatedToAsync();
     }
     
     /// <summary>
@@ -111,10 +113,13 @@ public partial class MainViewModel : ViewModelBase
         await page.OnNavigatedToAsync();
         
         // Update selected index
-        var item = NavigationItems.FirstOrDefault(n => n.Page == page);
-        if (item != null)
+        for (var i = 0; i < NavigationItems.Count; i++)
         {
-            SelectedNavigationIndex = NavigationItems.IndexOf(item);
+            if (NavigationItems[i].Page == page)
+            {
+                SelectedNavigationIndex = i;
+                break;
+            }
         }
     }
     
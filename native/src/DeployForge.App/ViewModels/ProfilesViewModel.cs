@@ -64,15 +64,7 @@ public partial class ProfilesViewModel : PageViewModelBase
         
         foreach (var profile in _templateService.GetBuiltInProfiles())
         {
-            BuiltInProfiles.Add(new ProfileCard
-            {
-                Profile = profile,
-                Name = profile.Name,
-                Description = profile.Description,
-                Icon = profile.Icon,
-                Type = profile.Type,
-                IsBuiltIn = true
-            });
+            BuiltInProfiles.Add(CreateCard(profile, isBuiltIn: true));
         }
     }
     
@@ -89,15 +81,7 @@ public partial class ProfilesViewModel : PageViewModelBase
             
             foreach (var profile in profiles)
             {
-                CustomProfiles.Add(new ProfileCard
-                {
-                    Profile = profile,
-                    Name = profile.Name,
-                    Description = profile.Description,
-                    Icon = profile.Icon,
-                    Type = profile.Type,
-                    IsBuiltIn = false
-                });
+                CustomProfiles.Add(CreateCard(profile, isBuiltIn: false));
             }
         }
         catch
@@ -290,6 +274,19 @@ public partial class ProfilesViewModel : PageViewModelBase
         }
     }
     
+    private static ProfileCard CreateCard(BuildProfile profile, bool isBuiltIn)
+    {
+        return new ProfileCard
+        {
+            Profile = profile,
+            Name = profile.Name,
+            Description = profile.Description,
+            Icon = profile.Icon,
+            Type = profile.Type,
+            IsBuiltIn = isBuiltIn
+        };
+    }
+    
     private static string SanitizeFileName(string name)
     {
         var invalid = Path.GetInvalidFileNameChars();
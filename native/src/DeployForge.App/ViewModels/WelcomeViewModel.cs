@@ -1,6 +1,7 @@
 using System.Collections.ObjectModel;
 using CommunityToolkit.Mvvm.ComponentModel;
 using CommunityToolkit.Mvvm.Input;
+using DeployForge.Core.Enums;
 using DeployForge.Core.Interfaces;
 using DeployForge.Core.Models;
 
@@ -15,6 +16,18 @@ public partial class WelcomeViewModel : PageViewModelBase
     private readonly IImageService _imageService;
     private readonly ISettingsService _settingsService;
     
+    /// <summary>
+    /// Incremented by every recent image load and clear; a load whose
+    /// generation is no longer current discards its results.
+    /// </summary>
+    private int _recentImagesGeneration;
+    
+    /// <summary>
+    /// File extensions accepted as Windows images by the picker and drop zone.
+    /// </summary>
+    public static IReadOnlyList<string> ImageFileExtensions { get; } =
+        Array.AsReadOnly(new[] { ".wim", ".esd", ".vhd", ".vhdx", ".iso" });
+    
     public override string Title => "Welcome";
     public override string Icon => "\uE80F";
     
@@ -50,10 +63,10 @@ public partial class WelcomeViewModel : PageViewModelBase
         _settingsService = settingsService;
         
         // Initialize quick actions
-        QuickActions.Add(new QuickAction("New Build", "\uE8F1", "Create a customized Windows image", OpenNewBuildAsync));
+        QuickActions.Add(new QuickAction("New Build", "\uE8F1", "Create a customized Windows image", () => ApplyQuickProfileAsync(null)));
         QuickActions.Add(new QuickAction("Load Template", "\uE8A5", "Load a saved configuration template", LoadTemplateAsync));
-        QuickActions.Add(new QuickAction("Gaming Profile", "\uE7FC", "Quick setup for gaming PC", ApplyGamingProfileAsync));
-        QuickActions.Add(new QuickAction("Developer Profile", "\uE943", "Quick setup for development workstation", ApplyDevProfileAsync));
+        QuickActions.Add(new QuickAction("Gaming Profile", "\uE7FC", "Quick setup for gaming PC", () => ApplyQuickProfileAsync(BuildProfileType.Gaming)));
+        QuickActions.Add(new QuickAction("Developer Profile", "\uE943", "Quick setup for development workstation", () => ApplyQuickProfileAsync(BuildProfileType.Developer)));
     }
     
     public override async Task OnNavigatedToAsync()
@@ -66,30 +79,48 @@ public partial class WelcomeViewModel : PageViewModelBase
     /// </summary>
     private async Task LoadRecentImagesAsync()
     {
-        RecentImages.Clear();
+        var generation = ++_recentImagesGeneration;
+        var paths = _settingsService.RecentImages.ToList();
         
-        foreach (var path in _settingsService.RecentImages)
+        // Query the filesystem off the UI thread so slow or offline shares don't stall it
+        var items = await Task.Run(() =>
         {
-            if (!File.Exists(path)) continue;
+            var result = new List<RecentImageItem>();
             
-            try
+            foreach (var path in paths)
             {
-                var fileInfo = new FileInfo(path);
-                RecentImages.Add(new RecentImageItem
+                try
                 {
-                    Path = path,
-                    FileName = fileInfo.Name,
-                    Size = FormatFileSize(fileInfo.Length),
-                    LastModified = fileInfo.LastWriteTime.ToString("g")
-                });
-            }
-            catch
-            {
-                // Skip invalid files
+                    // A single FileInfo stat covers the existence check, size and timestamp
+                    var fileInfo = new FileInfo(path);
+                    if (!fileInfo.Exists) continue;
+                    
+                    result.Add(new RecentImageItem
+                    {
+                        Path = path,
+                        FileName = fileInfo.Name,
+                        Size = FormatFileSize(fileInfo.Length),
+                        LastModified = fileInfo.LastWriteTime.ToString("g")
+                    });
+                }
+                catch
+                {
+                    // Skip invalid files
+                }
             }
-        }
+            
+            return result;
+        });
         
-        await Task.CompletedTask;
+        // A newer load or a clear ran while this one was on the thread pool
+        if (generation != _recentImagesGeneration) return;
+        
+        RecentImages.Clear();
+        
+        foreach (var item in items)
+        {
+            RecentImages.Add(item);
+        }
     }
     
     /// <summary>
@@ -125,7 +156,7 @@ public partial class WelcomeViewModel : PageViewModelBase
         if (string.IsNullOrWhiteSpace(path)) return;
         
         var extension = Path.GetExtension(path).ToLowerInvariant();
-        if (extension is ".wim" or ".esd" or ".vhd" or ".vhdx" or ".iso")
+        if (ImageFileExtensions.Contains(extension))
         {
             await OpenImageAsync(path);
         }
@@ -156,6 +187,8 @@ public partial class WelcomeViewModel : PageViewModelBase
     [RelayCommand]
     private async Task ClearRecentAsync()
     {
+        _recentImagesGeneration++;
+        
         if (_settingsService is SettingsService ss)
         {
             ss.ClearRecentImages();
@@ -165,25 +198,22 @@ public partial class WelcomeViewModel : PageViewModelBase
         RecentImages.Clear();
     }
     
-    private async Task OpenNewBuildAsync()
-    {
-        await _mainViewModel.NavigateToCommand.ExecuteAsync(_mainViewModel.BuildPage);
-    }
-    
     private async Task LoadTemplateAsync()
     {
         await _mainViewModel.NavigateToCommand.ExecuteAsync(_mainViewModel.ProfilesPage);
     }
     
-    private async Task ApplyGamingProfileAsync()
-    {
-        _mainViewModel.ProfilesPage.SelectProfile(Core.Enums.BuildProfileType.Gaming);
-        await _mainViewModel.NavigateToCommand.ExecuteAsync(_mainViewModel.BuildPage);
-    }
-    
-    private async Task ApplyDevProfileAsync()
+    /// <summary>
+    /// Selects a built-in profile, if one is given, and opens the build page.
+    /// </summary>
+    [RelayCommand]
+    private async Task ApplyQuickProfileAsync(BuildProfileType? profileType)
     {
-        _mainViewModel.ProfilesPage.SelectProfile(Core.Enums.BuildProfileType.Developer);
+        if (profileType is { } type)
+        {
+            _mainViewModel.ProfilesPage.SelectProfile(type);
+        }
+        
         await _mainViewModel.NavigateToCommand.ExecuteAsync(_mainViewModel.BuildPage);
     }
     
@@ -10,6 +10,9 @@ namespace DeployForge.App.Views;
 /// </summary>
 public sealed partial class MainWindow : Window
 {
+    private readonly SolidColorBrush _mountedBrush = new(Windows.UI.Color.FromArgb(255, 46, 204, 113));   // Green
+    private readonly SolidColorBrush _unmountedBrush = new(Windows.UI.Color.FromArgb(255, 149, 165, 166)); // Gray
+    
     /// <summary>
     /// Main ViewModel.
     /// </summary>
@@ -70,9 +73,7 @@ public sealed partial class MainWindow : Window
     /// </summary>
     private SolidColorBrush GetMountStatusColor(bool isMounted)
     {
-        return isMounted 
-            ? new SolidColorBrush(Windows.UI.Color.FromArgb(255, 46, 204, 113))  // Green
-            : new SolidColorBrush(Windows.UI.Color.FromArgb(255, 149, 165, 166)); // Gray
+        return isMounted ? _mountedBrush : _unmountedBrush;
     }
     
     /// <summary>
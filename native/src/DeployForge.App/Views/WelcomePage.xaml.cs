@@ -5,7 +5,6 @@ using Windows.ApplicationModel.DataTransfer;
 using Windows.Storage;
 using Windows.Storage.Pickers;
 using DeployForge.App.ViewModels;
-using DeployForge.Core.Enums;
 
 namespace DeployForge.App.Views;
 
@@ -47,11 +46,11 @@ public sealed partial class WelcomePage : Page
         
         picker.ViewMode = PickerViewMode.List;
         picker.SuggestedStartLocation = PickerLocationId.DocumentsLibrary;
-        picker.FileTypeFilter.Add(".wim");
-        picker.FileTypeFilter.Add(".esd");
-        picker.FileTypeFilter.Add(".vhd");
-        picker.FileTypeFilter.Add(".vhdx");
-        picker.FileTypeFilter.Add(".iso");
+        
+        foreach (var extension in WelcomeViewModel.ImageFileExtensions)
+        {
+            picker.FileTypeFilter.Add(extension);
+        }
         
         var file = await picker.PickSingleFileAsync();
         
@@ -104,53 +103,14 @@ public sealed partial class WelcomePage : Page
         {
             var items = await e.DataView.GetStorageItemsAsync();
             
+            // HandleDropAsync ignores files that are not Windows images
             if (items.Count > 0 && items[0] is StorageFile file)
             {
-                var extension = file.FileType.ToLowerInvariant();
-                
-                if (extension is ".wim" or ".esd" or ".vhd" or ".vhdx" or ".iso")
-                {
-                    await ViewModel.HandleDropCommand.ExecuteAsync(file.Path);
-                }
+                await ViewModel.HandleDropCommand.ExecuteAsync(file.Path);
             }
         }
     }
     
-    /// <summary>
-    /// Handles gaming profile button click.
-    /// </summary>
-    private async void GamingProfile_Click(object sender, RoutedEventArgs e)
-    {
-        MainViewModel.ProfilesPage.SelectProfile(BuildProfileType.Gaming);
-        await MainViewModel.NavigateToCommand.ExecuteAsync(MainViewModel.BuildPage);
-    }
-    
-    /// <summary>
-    /// Handles developer profile button click.
-    /// </summary>
-    private async void DeveloperProfile_Click(object sender, RoutedEventArgs e)
-    {
-        MainViewModel.ProfilesPage.SelectProfile(BuildProfileType.Developer);
-        await MainViewModel.NavigateToCommand.ExecuteAsync(MainViewModel.BuildPage);
-    }
-    
-    /// <summary>
-    /// Handles enterprise profile button click.
-    /// </summary>
-    private async void EnterpriseProfile_Click(object sender, RoutedEventArgs e)
-    {
-        MainViewModel.ProfilesPage.SelectProfile(BuildProfileType.Enterprise);
-        await MainViewModel.NavigateToCommand.ExecuteAsync(MainViewModel.BuildPage);
-    }
-    
-    /// <summary>
-    /// Handles custom build button click.
-    /// </summary>
-    private async void CustomBuild_Click(object sender, RoutedEventArgs e)
-    {
-        await MainViewModel.NavigateToCommand.ExecuteAsync(MainViewModel.BuildPage);
-    }
-    
     /// <summary>
     /// Handles recent image click.
     /// </summary>